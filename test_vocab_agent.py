@@ -2,13 +2,31 @@
 """Unit tests for vocab_agent.py"""
 
 import json
+import os
+import random
 import sqlite3
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import vocab_agent as va
 
 
+# Schema is created once; each test gets a page-level copy via the backup API
+# instead of re-running init_db's DDL.
+_TEMPLATE_DB = sqlite3.connect(":memory:")
+va.init_db(_TEMPLATE_DB)
+
+
+def fresh_db():
+    conn = sqlite3.connect(":memory:")
+    _TEMPLATE_DB.backup(conn)
+    return conn
+
+
 # ---------------------------------------------------------------------------
 # TestLevenshteinDistance
 # ---------------------------------------------------------------------------
@@ -44,6 +62,59 @@ class TestLevenshteinDistance(unittest.TestCase):
     def test_multi_edit(self):
         self.assertEqual(va.levenshtein("kitten", "sitting"), 3)
 
+    def test_matches_reference_dp(self):
+        def reference(s1, s2):
+            prev = list(range(len(s2) + 1))
+            for i, c1 in enumerate(s1):
+                curr = [i + 1]
+                for j, c2 in enumerate(s2):
+                    curr.append(min(prev[j + 1] + 1, curr[j] + 1, prev[j] + (c1 != c2)))
+                prev = curr
+            return prev[-1]
+
+        rng = random.Random(1234)
+        for _ in range(300):
+            # Mostly short words, plus some patterns wider than 64 bits.
+            limit = rng.choice([12, 12, 90])
+            s1 = "".join(rng.choice("abc") for _ in range(rng.randint(0, limit)))
+            s2 = "".join(rng.choice("abc") for _ in range(rng.randint(0, limit)))
+            self.assertEqual(va.levenshtein(s1, s2), reference(s1, s2), (s1, s2))
+
+    def test_long_strings(self):
+        # Longer than one 64-bit word on both sides.
+        s1 = "a" * 70 + "xyz"
+        s2 = "a" * 70
+        self.assertEqual(va.levenshtein(s1, s2), 3)
+        self.assertEqual(va.levenshtein("ab" * 40, "ba" * 40), 2)
+
+    def test_max_dist_within_limit(self):
+        self.assertEqual(va.levenshtein("kitten", "sitting", max_dist=3), 3)
+
+    def test_max_dist_exceeded(self):
+        self.assertEqual(va.levenshtein("kitten", "sitting", max_dist=2), 3)
+        self.assertEqual(va.levenshtein("cat", "elephant", max_dist=2), 3)
+
+    def test_max_dist_matches_clamped_distance(self):
+        rng = random.Random(99)
+        for _ in range(300):
+            length = rng.choice([10, 72])
+            s1 = "".join(rng.choice("ab") for _ in range(rng.randint(length - 8, length)))
+            s2 = list(s1)
+            for _ in range(rng.randint(0, 8)):
+                s2[rng.randrange(len(s2))] = rng.choice("abc")
+            s2 = "".join(s2[rng.randint(0, 2):])
+            k = rng.randint(0, 6)
+            expected = min(va.levenshtein(s1, s2), k + 1)
+            self.assertEqual(va.levenshtein(s1, s2, max_dist=k), expected, (s1, s2, k))
+
+    def test_batch_matches_pairwise(self):
+        candidates = ["", "kitten", "sitting", "kit", "mitten", "kittens" * 3, "x" * 80]
+        for query in ["kitten", "", "k" * 70]:
+            self.assertEqual(
+                va.levenshtein_batch(query, candidates),
+                [va.levenshtein(query, c) for c in candidates],
+            )
+
 
 # ---------------------------------------------------------------------------
 # TestKeywordOverlap
@@ -85,6 +156,18 @@ class TestKeywordOverlap(unittest.TestCase):
         # Words < 3 chars should not count as matches
         self.assertFalse(va.keyword_overlap("go do be", "go do be"))
 
+    def test_hyphenated_words_split(self):
+        self.assertTrue(va.keyword_overlap("long-lasting", "lasting a while"))
+
+    def test_digits_and_underscores_split(self):
+        self.assertTrue(va.keyword_overlap("x1brief_y", "brief"))
+        self.assertFalse(va.keyword_overlap("ab1cd", "abcd"))
+
+    def test_non_ascii_letters_split(self):
+        self.assertTrue(va.keyword_overlap("cafébrief", "brief"))
+        self.assertTrue(va.keyword_overlap("xŝtelo", "telo"))
+        self.assertFalse(va.keyword_overlap("naïve", "naive"))
+
 
 # ---------------------------------------------------------------------------
 # TestSentenceHeuristics
@@ -137,6 +220,16 @@ class TestSentenceHeuristics(unittest.TestCase):
         self.assertFalse(ok)
         self.assertIn("original", msg)
 
+    def test_copied_example_with_spacing_fails(self):
+        examples = ["The ephemeral nature of cherry blossoms makes them special."]
+        ok, msg = va.check_sentence_heuristics(
+            "the  ephemeral nature of   CHERRY blossoms makes them special.",
+            "ephemeral",
+            examples
+        )
+        self.assertFalse(ok)
+        self.assertIn("original", msg)
+
     def test_original_sentence_passes(self):
         examples = ["The ephemeral nature of cherry blossoms makes them special."]
         ok, _ = va.check_sentence_heuristics(
@@ -161,6 +254,12 @@ class TestSentenceHeuristics(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 class TestSentenceEvalWithClaude(unittest.TestCase):
+    def setUp(self):
+        va._SENTENCE_VERDICTS.clear()
+        env = patch.dict(os.environ, {"VOCAB_USE_CLI": "1"})
+        env.start()
+        self.addCleanup(env.stop)
+
     @patch("vocab_agent.subprocess.run")
     def test_pass_response(self, mock_run):
         mock_run.return_value = MagicMock(
@@ -210,6 +309,149 @@ class TestSentenceEvalWithClaude(unittest.TestCase):
         self.assertTrue(ok)
         self.assertIn("auto-approved", feedback.lower())
 
+    @patch("vocab_agent.subprocess.run")
+    def test_verdict_cached(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="FAIL Not quite.")
+        first = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        second = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertEqual(first, second)
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("vocab_agent.subprocess.run")
+    def test_fallback_not_cached(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=1, stdout="")
+        va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        mock_run.return_value = MagicMock(returncode=0, stdout="FAIL Not quite.")
+        ok, _ = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertFalse(ok)
+        self.assertEqual(mock_run.call_count, 2)
+
+
+# ---------------------------------------------------------------------------
+# TestBatchSentenceEval
+# ---------------------------------------------------------------------------
+
+class TestBatchSentenceEval(unittest.TestCase):
+    def setUp(self):
+        va._SENTENCE_VERDICTS.clear()
+
+    @patch("vocab_agent._ask_claude")
+    def test_single_request_for_batch(self, mock_ask):
+        mock_ask.return_value = "1. PASS Good usage.\n2. FAIL Wrong meaning.\n3) pass Fine."
+        results = va.evaluate_sentences_with_claude(["one", "two", "three"], "word", "meaning")
+        self.assertEqual(mock_ask.call_count, 1)
+        self.assertEqual([ok for ok, _ in results], [True, False, True])
+        self.assertEqual(results[1][1], "FAIL Wrong meaning.")
+
+    @patch("vocab_agent._ask_claude")
+    def test_missing_verdict_falls_back_to_single_call(self, mock_ask):
+        mock_ask.side_effect = ["1. PASS Good usage.", "FAIL Wrong meaning."]
+        results = va.evaluate_sentences_with_claude(["one", "two"], "word", "meaning")
+        self.assertEqual(mock_ask.call_count, 2)
+        self.assertEqual([ok for ok, _ in results], [True, False])
+        self.assertIn('"two"', mock_ask.call_args[0][0])
+
+    @patch("vocab_agent._ask_claude", return_value=None)
+    def test_unavailable_auto_approves_without_retrying(self, mock_ask):
+        results = va.evaluate_sentences_with_claude(["one", "two"], "word", "meaning")
+        self.assertEqual(mock_ask.call_count, 1)
+        self.assertTrue(all(ok for ok, _ in results))
+        self.assertIn("unavailable", results[0][1].lower())
+
+
+# ---------------------------------------------------------------------------
+# TestSentenceEvalWithApi
+# ---------------------------------------------------------------------------
+
+class TestSentenceEvalWithApi(unittest.TestCase):
+    def setUp(self):
+        va._SENTENCE_VERDICTS.clear()
+        env = patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("VOCAB_USE_CLI", None)
+        conn_patch = patch("vocab_agent._api_connection")
+        self.conn = conn_patch.start().return_value
+        self.addCleanup(conn_patch.stop)
+
+    def _respond(self, status, payload):
+        self.conn.getresponse.return_value = MagicMock(
+            status=status, read=MagicMock(return_value=json.dumps(payload).encode())
+        )
+
+    @patch("vocab_agent.subprocess.run")
+    def test_pass_response(self, mock_run):
+        self._respond(200, {"content": [{"type": "text", "text": "PASS Nice usage."}]})
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("PASS", feedback)
+        mock_run.assert_not_called()
+        _, path, body, headers = self.conn.request.call_args[0]
+        self.assertEqual(path, "/v1/messages")
+        self.assertEqual(headers["x-api-key"], "test-key")
+        self.assertIn("test sentence", json.loads(body)["messages"][0]["content"])
+
+    def test_fail_response(self):
+        self._respond(200, {"content": [{"type": "text", "text": "FAIL Wrong meaning."}]})
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertFalse(ok)
+        self.assertIn("FAIL", feedback)
+
+    def test_http_error_fallback(self):
+        self._respond(529, {"type": "error", "error": {"type": "overloaded_error"}})
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("unavailable", feedback.lower())
+
+    def test_dropped_connection_retried_once(self):
+        self._respond(200, {"content": [{"type": "text", "text": "FAIL Wrong meaning."}]})
+        self.conn.request.side_effect = [ConnectionResetError, None]
+        ok, _ = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertFalse(ok)
+        self.assertEqual(self.conn.request.call_count, 2)
+        self.conn.close.assert_called_once()
+
+    def test_connection_failure_fallback(self):
+        self.conn.request.side_effect = OSError
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("unavailable", feedback.lower())
+
+    def test_remote_disconnect_retried_once(self):
+        self._respond(200, {"content": [{"type": "text", "text": "PASS Nice usage."}]})
+        self.conn.getresponse.side_effect = [
+            va.http.client.RemoteDisconnected, self.conn.getresponse.return_value,
+        ]
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("PASS", feedback)
+        self.assertEqual(self.conn.request.call_count, 2)
+
+    def test_reset_while_reading_body_not_retried(self):
+        self.conn.getresponse.return_value = MagicMock(
+            status=200, read=MagicMock(side_effect=ConnectionResetError)
+        )
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("unavailable", feedback.lower())
+        self.assertEqual(self.conn.request.call_count, 1)
+
+    def test_timeout_not_retried(self):
+        self.conn.getresponse.side_effect = TimeoutError
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("unavailable", feedback.lower())
+        self.assertEqual(self.conn.request.call_count, 1)
+
+    def test_non_json_error_body_not_retried(self):
+        self.conn.getresponse.return_value = MagicMock(
+            status=502, read=MagicMock(return_value=b"<html>Bad Gateway</html>")
+        )
+        ok, feedback = va.evaluate_sentence_with_claude("test sentence", "word", "meaning")
+        self.assertTrue(ok)
+        self.assertIn("unavailable", feedback.lower())
+        self.assertEqual(self.conn.request.call_count, 1)
+
 
 # ---------------------------------------------------------------------------
 # TestDatabase
@@ -217,8 +459,7 @@ class TestSentenceEvalWithClaude(unittest.TestCase):
 
 class TestDatabase(unittest.TestCase):
     def setUp(self):
-        self.conn = sqlite3.connect(":memory:")
-        va.init_db(self.conn)
+        self.conn = fresh_db()
 
     def tearDown(self):
         self.conn.close()
@@ -229,6 +470,42 @@ class TestDatabase(unittest.TestCase):
         ).fetchone()
         self.assertIsNotNone(row)
 
+    def test_init_db_creates_indexes(self):
+        names = {r[0] for r in self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='words_seen'"
+        )}
+        self.assertIn("idx_words_seen_date_completed", names)
+        self.assertIn("idx_words_seen_date_shown", names)
+
+    def _plan(self, sql, params):
+        return " ".join(r[-1] for r in self.conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+    def test_date_lookups_use_indexes(self):
+        self.assertIn("idx_words_seen_date_completed",
+                      self._plan(va._SQL_TODAY_COMPLETED, ("2025-01-15",)))
+        self.assertIn("idx_words_seen_date_completed",
+                      self._plan(va._SQL_COMPLETED_DATES, ("2025-01-15",)))
+        self.assertIn("idx_words_seen_date_shown",
+                      self._plan(va._SQL_TODAYS_WORD, ("2025-01-15",)))
+
+    def test_dates_bound_not_interpolated(self):
+        conn = MagicMock(wraps=self.conn)
+        va.save_word_shown(conn, "test", '{}', "2025-01-15")
+        va.get_todays_word(conn, "2025-01-15")
+        va.save_completion(conn, "test", "2025-01-15")
+        va.is_today_completed(conn, "2025-01-15")
+        self.assertEqual(va.get_streak(conn, "2025-01-15"), 1)
+        calls = conn.execute.call_args_list + conn.executemany.call_args_list
+        self.assertTrue(calls)
+        for c in calls:
+            self.assertNotIn("2025-01-15", c.args[0])
+
+    def test_init_db_idempotent(self):
+        va.init_db(self.conn)
+        va.save_word_shown(self.conn, "test", '{}', "2025-01-15")
+        va.init_db(self.conn)
+        self.assertEqual(va.get_used_words(self.conn), {"test"})
+
     def test_is_today_completed_false(self):
         self.assertFalse(va.is_today_completed(self.conn, "2025-01-15"))
 
@@ -262,6 +539,20 @@ class TestDatabase(unittest.TestCase):
         count = self.conn.execute("SELECT COUNT(*) FROM words_seen").fetchone()[0]
         self.assertEqual(count, 1)
 
+    def test_save_words_shown(self):
+        va.save_words_shown(self.conn, [
+            ("alpha", '{"word":"alpha"}', "2025-01-14"),
+            ("beta", '{"word":"beta"}', "2025-01-15"),
+            ("alpha", '{}', "2025-01-16"),
+        ])
+        rows = self.conn.execute(
+            "SELECT word, date_shown, api_data FROM words_seen ORDER BY word"
+        ).fetchall()
+        self.assertEqual(rows, [
+            ("alpha", "2025-01-14", '{"word":"alpha"}'),
+            ("beta", "2025-01-15", '{"word":"beta"}'),
+        ])
+
     def test_save_notes(self):
         va.save_word_shown(self.conn, "test", '{}', "2025-01-15")
         va.save_notes(self.conn, "test", "my notes about this word")
@@ -308,17 +599,19 @@ class TestDatabase(unittest.TestCase):
 
 class TestStreakCalculation(unittest.TestCase):
     def setUp(self):
-        self.conn = sqlite3.connect(":memory:")
-        va.init_db(self.conn)
+        self.conn = fresh_db()
 
     def tearDown(self):
         self.conn.close()
 
     def _complete(self, word, date):
-        self.conn.execute(
+        self._complete_many([(word, date)])
+
+    def _complete_many(self, rows):
+        self.conn.executemany(
             "INSERT INTO words_seen (word, date_shown, date_completed, quiz_passed) "
             "VALUES (?, ?, ?, 1)",
-            (word, date, date),
+            ((word, date, date) for word, date in rows),
         )
         self.conn.commit()
 
@@ -352,10 +645,14 @@ class TestStreakCalculation(unittest.TestCase):
         self._complete("w3", "2025-02-01")
         self.assertEqual(va.get_streak(self.conn, "2025-02-01"), 3)
 
+    def test_later_dates_ignored(self):
+        self._complete("w1", "2025-01-14")
+        self._complete("w2", "2025-01-15")
+        self._complete("w3", "2025-01-16")
+        self.assertEqual(va.get_streak(self.conn, "2025-01-15"), 2)
+
     def test_long_streak(self):
-        for i in range(10):
-            date = f"2025-01-{i + 1:02d}"
-            self._complete(f"w{i}", date)
+        self._complete_many((f"w{i}", f"2025-01-{i + 1:02d}") for i in range(10))
         self.assertEqual(va.get_streak(self.conn, "2025-01-10"), 10)
 
 
@@ -365,8 +662,7 @@ class TestStreakCalculation(unittest.TestCase):
 
 class TestWordSelection(unittest.TestCase):
     def setUp(self):
-        self.conn = sqlite3.connect(":memory:")
-        va.init_db(self.conn)
+        self.conn = fresh_db()
         self.sample_words = [
             {"word": "ephemeral", "pos": "adjective", "definition": "lasting a very short time",
              "example": "The ephemeral nature of fame.", "synonyms": ["fleeting", "transient"]},
@@ -407,16 +703,134 @@ class TestWordSelection(unittest.TestCase):
         word_data = va.pick_word(self.conn, "2025-01-15")
         self.assertEqual(word_data["word"], "ephemeral")
 
+    def test_resume_does_not_rewrite_fresh_data(self):
+        api_data = json.dumps({
+            "word": "cogent",
+            "definitions": [{"definition": "clear and convincing"}],
+        })
+        va.save_word_shown(self.conn, "cogent", api_data, "2025-01-15")
+        with patch("vocab_agent._json_dumps") as mock_dumps, \
+             patch("vocab_agent.load_words") as mock_load:
+            word_data = va.pick_word(self.conn, "2025-01-15")
+        mock_dumps.assert_not_called()
+        mock_load.assert_not_called()
+        self.assertEqual(word_data["definitions"][0]["definition"], "clear and convincing")
+
+    def test_resumed_data_not_shared_between_calls(self):
+        api_data = json.dumps({
+            "word": "cogent",
+            "definitions": [{"definition": "clear and convincing"}],
+        })
+        va.save_word_shown(self.conn, "cogent", api_data, "2025-01-15")
+        va.pick_word(self.conn, "2025-01-15")["definitions"].clear()
+        word_data = va.pick_word(self.conn, "2025-01-15")
+        self.assertEqual(word_data["definitions"][0]["definition"], "clear and convincing")
+
+    @patch("vocab_agent.load_words")
+    @patch("vocab_agent.API_WAIT_SECONDS", 0.05)
+    def test_slow_api_falls_back_to_offline_definition(self, mock_load):
+        mock_load.return_value = self.sample_words[:1]
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_fetch(word):
+            release.wait(5)
+            return {"word": word, "meanings": [{"definitions": [{"definition": "late"}]}]}
+
+        with patch("vocab_agent.fetch_api_data", side_effect=slow_fetch):
+            word_data = va.pick_word(self.conn, "2025-01-15")
+        self.assertEqual(word_data["definitions"][0]["definition"], "lasting a very short time")
+
+    @patch("vocab_agent.load_words")
+    @patch("vocab_agent.API_WAIT_SECONDS", 0.05)
+    def test_late_api_result_saved(self, mock_load):
+        mock_load.return_value = self.sample_words[:1]
+        release = threading.Event()
+        self.addCleanup(release.set)
+        fetched = threading.Event()
+
+        def slow_fetch(word):
+            release.wait(5)
+            fetched.set()
+            return {"word": word, "meanings": [{"definitions": [{"definition": "late"}]}]}
+
+        with patch("vocab_agent.fetch_api_data", side_effect=slow_fetch):
+            word_data = va.pick_word(self.conn, "2025-01-15")
+            va.save_late_api_data(self.conn)
+            stored = json.loads(va.get_todays_word(self.conn, "2025-01-15")["api_data"])
+            self.assertEqual(stored["definitions"][0]["definition"], "lasting a very short time")
+
+            release.set()
+            fetched.wait(5)
+            for _ in range(100):
+                va.save_late_api_data(self.conn)
+                if va._pending_api is None:
+                    break
+                time.sleep(0.01)
+        stored = json.loads(va.get_todays_word(self.conn, "2025-01-15")["api_data"])
+        self.assertEqual(stored["definitions"][0]["definition"], "late")
+        self.assertEqual(word_data["definitions"][0]["definition"], "lasting a very short time")
+
+    @patch("vocab_agent.load_words")
+    @patch("vocab_agent.API_WAIT_SECONDS", 0.01)
+    def test_late_api_result_saved_under_offline_headword(self, mock_load):
+        mock_load.return_value = self.sample_words[:1]
+        pending = va.queue.SimpleQueue()
+        with patch("vocab_agent.fetch_api_data_async", return_value=pending):
+            va.pick_word(self.conn, "2025-01-15")
+        pending.put({"word": "Ephemeral", "meanings": [{"definitions": [{"definition": "late"}]}]})
+        va.save_late_api_data(self.conn)
+        stored = json.loads(va.get_todays_word(self.conn, "2025-01-15")["api_data"])
+        self.assertEqual(stored["definitions"][0]["definition"], "late")
+
+    @patch("vocab_agent.load_words")
+    def test_fast_api_result_used(self, mock_load):
+        mock_load.return_value = self.sample_words[:1]
+        api_entry = {"word": "ephemeral", "meanings": [{"definitions": [{"definition": "short-lived"}]}]}
+        with patch("vocab_agent.fetch_api_data", return_value=api_entry):
+            word_data = va.pick_word(self.conn, "2025-01-15")
+        self.assertEqual(word_data["definitions"][0]["definition"], "short-lived")
+        self.assertIsNone(va._pending_api)
+
     @patch("vocab_agent.load_words")
     @patch("vocab_agent.fetch_api_data", return_value=None)
     def test_pool_exhausted(self, mock_api, mock_load):
         mock_load.return_value = self.sample_words
-        for w in self.sample_words:
-            va.save_word_shown(self.conn, w["word"], '{}', "2025-01-01")
+        va.save_words_shown(self.conn, [(w["word"], '{}', "2025-01-01") for w in self.sample_words])
         with self.assertRaises(SystemExit):
             va.pick_word(self.conn, "2025-01-15")
 
 
+# ---------------------------------------------------------------------------
+# TestLoadWords
+# ---------------------------------------------------------------------------
+
+class TestLoadWords(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "words.json"
+        self.path.write_text(json.dumps([{"word": "cogent"}]))
+        file_patch = patch("vocab_agent.WORDS_FILE", self.path)
+        file_patch.start()
+        self.addCleanup(file_patch.stop)
+        va._words_cache.clear()
+
+    def test_cached_between_calls(self):
+        first = va.load_words()
+        with patch("vocab_agent.json.loads") as mock_load:
+            second = va.load_words()
+        mock_load.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_reloads_when_file_changes(self):
+        self.assertEqual(va.load_words(), ({"word": "cogent"},))
+        self.path.write_text(json.dumps([{"word": "ephemeral"}]))
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(va.load_words(), ({"word": "ephemeral"},))
+
+
 # ---------------------------------------------------------------------------
 # TestFormatApiData
 # ---------------------------------------------------------------------------
@@ -475,8 +889,7 @@ class TestFormatApiData(unittest.TestCase):
 
     def test_pick_word_returns_nonempty_definitions(self):
         """End-to-end: pick_word with no API should still have definitions."""
-        conn = sqlite3.connect(":memory:")
-        va.init_db(conn)
+        conn = fresh_db()
         sample = [
             {"word": "ephemeral", "pos": "adjective",
              "definition": "lasting a very short time",
@@ -496,8 +909,7 @@ class TestFormatApiData(unittest.TestCase):
         bypassing format_api_data. If the DB has stale data with empty
         definitions (written before the flat->nested fix), definitions
         are still empty on resume."""
-        conn = sqlite3.connect(":memory:")
-        va.init_db(conn)
+        conn = fresh_db()
         stale_api_data = json.dumps({
             "word": "ephemeral",
             "phonetic": "",
@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 """Interactive vocabulary learning agent with daily word practice and quizzes."""
 
+import http.client
 import json
 import sqlite3
 import urllib.request
-import readline  # noqa: F401 — imported for input() history side-effect
 import subprocess
 import signal
 import os
 import sys
 import time
 import datetime
+import functools
+import itertools
 import random
+import queue
 import re
 import textwrap
+import threading
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -24,6 +28,13 @@ VOCAB_DIR = Path.home() / "vocab-agent"
 DB_PATH = VOCAB_DIR / "vocab.db"
 WORDS_FILE = VOCAB_DIR / "words.json"
 
+# How long pick_word waits for dictionaryapi.dev before using words.json.
+API_WAIT_SECONDS = 1.5
+
+CLAUDE_CLI_ARGS = ["claude", "-p", "--model", "sonnet", "--max-budget-usd", "0.05"]
+CLAUDE_API_HOST = "api.anthropic.com"
+CLAUDE_API_MODEL = "claude-sonnet-4-5"
+
 BOLD = "\033[1m"
 DIM = "\033[2m"
 GREEN = "\033[32m"
@@ -33,10 +44,66 @@ RED = "\033[31m"
 MAGENTA = "\033[35m"
 RESET = "\033[0m"
 
+# Compact JSON for stored blobs and request bodies. json.dumps with custom
+# separators would build a new encoder on every call, so keep one around.
+_json_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Keyword tokens: runs of three or more letters in lowercased text.
+_NONALPHA_TABLE = bytes(c if 97 <= c <= 122 else 32 for c in range(256))
+
+# One line of a batched Claude reply, e.g. "2. FAIL Uses the wrong sense."
+_VERDICT_LINE_RE = re.compile(r"^\s*(\d+)[.):]?\s+(PASS|FAIL)\b(.*)$", re.IGNORECASE | re.MULTILINE)
+
+STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "shall", "can", "to", "of", "in", "for",
+    "on", "with", "at", "by", "from", "as", "into", "through", "during",
+    "before", "after", "above", "below", "between", "out", "off", "over",
+    "under", "again", "further", "then", "once", "it", "its", "this",
+    "that", "these", "those", "i", "me", "my", "we", "our", "you", "your",
+    "he", "him", "his", "she", "her", "they", "them", "their", "what",
+    "which", "who", "whom", "when", "where", "why", "how", "all", "each",
+    "every", "both", "few", "more", "most", "other", "some", "such", "no",
+    "not", "only", "same", "so", "than", "too", "very", "just", "about",
+    "also", "and", "but", "or", "if", "because", "until", "while", "up",
+    "down",
+})
+
 # ---------------------------------------------------------------------------
 # Database layer
 # ---------------------------------------------------------------------------
 
+# Statements are kept as constants (with values bound, never interpolated) so
+# the sqlite3 statement cache reuses the prepared statement on every call.
+_SQL_TODAY_COMPLETED = "SELECT 1 FROM words_seen WHERE date_completed = ? LIMIT 1"
+
+_SQL_USED_WORDS = "SELECT word FROM words_seen"
+
+_SQL_TODAYS_WORD = (
+    "SELECT word, date_shown, date_completed, api_data, user_notes, "
+    "quiz_attempts, quiz_passed FROM words_seen "
+    "WHERE date_shown = ? AND quiz_passed = 0"
+)
+
+_SQL_SAVE_WORD = "INSERT OR IGNORE INTO words_seen (word, date_shown, api_data) VALUES (?, ?, ?)"
+
+_SQL_SAVE_API_DATA = "UPDATE words_seen SET api_data = ? WHERE word = ?"
+
+_SQL_SAVE_NOTES = "UPDATE words_seen SET user_notes = ? WHERE word = ?"
+
+_SQL_SAVE_COMPLETION = (
+    "UPDATE words_seen SET quiz_passed = 1, date_completed = ?, "
+    "quiz_attempts = quiz_attempts + 1 WHERE word = ?"
+)
+
+_SQL_INCREMENT_ATTEMPTS = "UPDATE words_seen SET quiz_attempts = quiz_attempts + 1 WHERE word = ?"
+
+_SQL_COMPLETED_DATES = (
+    "SELECT DISTINCT date_completed FROM words_seen "
+    "WHERE date_completed IS NOT NULL AND date_completed <= ?"
+)
+
 
 def init_db(conn):
     conn.execute("""
@@ -51,30 +118,29 @@ def init_db(conn):
             quiz_passed INTEGER DEFAULT 0
         );
     """)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_words_seen_date_completed "
+        "ON words_seen(date_completed) WHERE date_completed IS NOT NULL"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_words_seen_date_shown ON words_seen(date_shown)"
+    )
     conn.commit()
 
 
 def is_today_completed(conn, today=None):
     today = today or datetime.date.today().isoformat()
-    row = conn.execute(
-        "SELECT 1 FROM words_seen WHERE date_completed = ? LIMIT 1", (today,)
-    ).fetchone()
+    row = conn.execute(_SQL_TODAY_COMPLETED, (today,)).fetchone()
     return row is not None
 
 
 def get_used_words(conn):
-    rows = conn.execute("SELECT word FROM words_seen").fetchall()
-    return {r[0] for r in rows}
+    return frozenset(word for (word,) in conn.execute(_SQL_USED_WORDS))
 
 
 def get_todays_word(conn, today=None):
     today = today or datetime.date.today().isoformat()
-    row = conn.execute(
-        "SELECT word, date_shown, date_completed, api_data, user_notes, "
-        "quiz_attempts, quiz_passed FROM words_seen "
-        "WHERE date_shown = ? AND quiz_passed = 0",
-        (today,),
-    ).fetchone()
+    row = conn.execute(_SQL_TODAYS_WORD, (today,)).fetchone()
     if row is None:
         return None
     return {
@@ -90,56 +156,44 @@ def get_todays_word(conn, today=None):
 
 def save_word_shown(conn, word, api_data_json, today=None):
     today = today or datetime.date.today().isoformat()
-    conn.execute(
-        "INSERT OR IGNORE INTO words_seen (word, date_shown, api_data) VALUES (?, ?, ?)",
-        (word, today, api_data_json),
+    save_words_shown(conn, [(word, api_data_json, today)])
+
+
+def save_words_shown(conn, rows):
+    # rows: (word, api_data_json, date_shown) tuples, written in one transaction.
+    conn.executemany(
+        _SQL_SAVE_WORD,
+        ((word, date_shown, api_data_json) for word, api_data_json, date_shown in rows),
     )
     conn.commit()
 
 
 def save_notes(conn, word, notes):
-    conn.execute("UPDATE words_seen SET user_notes = ? WHERE word = ?", (notes, word))
+    conn.execute(_SQL_SAVE_NOTES, (notes, word))
     conn.commit()
 
 
 def save_completion(conn, word, today=None):
     today = today or datetime.date.today().isoformat()
-    conn.execute(
-        "UPDATE words_seen SET quiz_passed = 1, date_completed = ?, "
-        "quiz_attempts = quiz_attempts + 1 WHERE word = ?",
-        (today, word),
-    )
+    conn.execute(_SQL_SAVE_COMPLETION, (today, word))
     conn.commit()
 
 
 def increment_attempts(conn, word):
-    conn.execute(
-        "UPDATE words_seen SET quiz_attempts = quiz_attempts + 1 WHERE word = ?",
-        (word,),
-    )
+    conn.execute(_SQL_INCREMENT_ATTEMPTS, (word,))
     conn.commit()
 
 
 def get_streak(conn, today=None):
     today = today or datetime.date.today().isoformat()
-    # The today value is an ISO date string we control, safe to interpolate.
-    query = f"""
-        WITH RECURSIVE
-        completed_dates(d) AS (
-            SELECT DISTINCT date_completed FROM words_seen WHERE date_completed IS NOT NULL
-        ),
-        walk(day, steps) AS (
-            SELECT date('{today}'), 0
-            WHERE date('{today}') IN (SELECT d FROM completed_dates)
-            UNION ALL
-            SELECT date(walk.day, '-1 day'), walk.steps + 1
-            FROM walk
-            WHERE date(walk.day, '-1 day') IN (SELECT d FROM completed_dates)
-        )
-        SELECT COALESCE(MAX(steps) + 1, 0) FROM walk;
-    """
-    row = conn.execute(query).fetchone()
-    return row[0] if row else 0
+    # One indexed scan for the completed dates, then walk back from today.
+    dates = {d for (d,) in conn.execute(_SQL_COMPLETED_DATES, (today,))}
+    day = datetime.date.fromisoformat(today)
+    streak = 0
+    while day.isoformat() in dates:
+        streak += 1
+        day -= datetime.timedelta(days=1)
+    return streak
 
 
 # ---------------------------------------------------------------------------
@@ -147,61 +201,207 @@ def get_streak(conn, today=None):
 # ---------------------------------------------------------------------------
 
 
-def levenshtein(s1, s2):
+@functools.lru_cache(maxsize=256)
+def _pattern_masks(pattern):
+    # Cached: recall_quiz compares every attempt against the same word.
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def _levenshtein_bitparallel(peq, m, text, max_dist=None):
+    # Myers/Hyyrö bit-vector algorithm: one column of the DP matrix is packed
+    # into the VP/VN bitvectors, so each character of text costs a handful of
+    # integer ops instead of m cell updates. peq maps each pattern character
+    # to the bitmask of its positions; m is the pattern length.
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    vp, vn = mask, 0
+    score = m
+    # The score can drop by at most one per remaining character of text, so
+    # once it exceeds max_dist plus what is left it can never come back.
+    budget = None if max_dist is None else max_dist + len(text)
+    for c in text:
+        bj = peq.get(c, 0)
+        d0 = ((vp + (bj & vp)) ^ vp) | bj | vn
+        hn = vp & d0
+        hp = vn | ~(vp | d0)
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        x = (hp << 1) | 1
+        vn = x & d0 & mask
+        vp = ((hn << 1) | ~(x | d0)) & mask
+        if budget is not None:
+            budget -= 1
+            if score > budget:
+                return max_dist + 1
+    if budget is not None and score > budget:
+        return max_dist + 1
+    return score
+
+
+def levenshtein(s1, s2, max_dist=None):
+    # With max_dist set, any distance above it is reported as max_dist + 1.
     if len(s1) < len(s2):
-        return levenshtein(s2, s1)
+        return levenshtein(s2, s1, max_dist)
+    if max_dist is not None and len(s1) - len(s2) > max_dist:
+        return max_dist + 1
     if len(s2) == 0:
         return len(s1)
-    prev = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        curr = [i + 1]
-        for j, c2 in enumerate(s2):
-            insert = prev[j + 1] + 1
-            delete = curr[j] + 1
-            replace = prev[j] + (0 if c1 == c2 else 1)
-            curr.append(min(insert, delete, replace))
-        prev = curr
-    return prev[-1]
-
-
-def get_stopwords():
-    return {
-        "a", "an", "the", "is", "are", "was", "were", "be", "been", "being",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "shall", "can", "to", "of", "in", "for",
-        "on", "with", "at", "by", "from", "as", "into", "through", "during",
-        "before", "after", "above", "below", "between", "out", "off", "over",
-        "under", "again", "further", "then", "once", "it", "its", "this",
-        "that", "these", "those", "i", "me", "my", "we", "our", "you", "your",
-        "he", "him", "his", "she", "her", "they", "them", "their", "what",
-        "which", "who", "whom", "when", "where", "why", "how", "all", "each",
-        "every", "both", "few", "more", "most", "other", "some", "such", "no",
-        "not", "only", "same", "so", "than", "too", "very", "just", "about",
-        "also", "and", "but", "or", "if", "because", "until", "while", "up",
-        "down",
-    }
+    # Python ints are arbitrary precision, so the bitvectors simply grow with
+    # the pattern; past 64 characters each op spans several machine words.
+    return _levenshtein_bitparallel(_pattern_masks(s2), len(s2), s1, max_dist)
+
+
+def levenshtein_batch(query, candidates, max_dist=None):
+    # Distances from one query to many candidates, building the query's
+    # bitmasks once instead of once per pair.
+    if not query:
+        return [levenshtein(query, c, max_dist) for c in candidates]
+    peq = _pattern_masks(query)
+    return [_levenshtein_bitparallel(peq, len(query), c, max_dist) for c in candidates]
+
+
+def _words(text):
+    # Non-ASCII letters become "?" and then a space, so they split words
+    # exactly as they would under an [a-z] regex.
+    lowered = text.lower().encode("ascii", "replace").translate(_NONALPHA_TABLE).decode()
+    return [w for w in lowered.split() if len(w) > 2]
+
+
+def _tokenize(text):
+    return frozenset(w for w in _words(text) if w not in STOPWORDS)
+
+
+def _has_overlap(user_text, ref_tokens):
+    # Stopwords never make it into ref_tokens, so user tokens can be checked
+    # against it directly, stopping at the first shared keyword.
+    return any(w in ref_tokens for w in _words(user_text))
 
 
 def keyword_overlap(user_text, reference_text):
-    stopwords = get_stopwords()
-    tokenize = lambda t: {w for w in re.split(r"[^a-zA-Z]+", t.lower()) if len(w) >= 3 and w not in stopwords}
-    user_tokens = tokenize(user_text)
-    ref_tokens = tokenize(reference_text)
-    return len(user_tokens & ref_tokens) >= 1
+    return _has_overlap(user_text, _tokenize(reference_text))
 
 
-def check_sentence_heuristics(sentence, word, examples):
-    if word.lower() not in sentence.lower():
+def _normalize(text):
+    return " ".join(text.lower().split())
+
+
+def _sentence_heuristics(sentence, word_lc, normalized_examples):
+    # Core of check_sentence_heuristics for callers that already lowercased
+    # the word and normalized the examples once, outside a retry loop.
+    normalized = _normalize(sentence)
+    if word_lc not in normalized:
         return False, "Your sentence must contain the word."
-    if len(sentence.split()) < 5:
+    if len(normalized.split()) < 5:
         return False, "Please write a longer sentence (at least 5 words)."
-    for ex in examples:
-        if ex.lower() in sentence.lower() or sentence.lower() in ex.lower():
-            return False, "Please write your own original sentence."
+    if any(ex in normalized or normalized in ex for ex in normalized_examples):
+        return False, "Please write your own original sentence."
     return True, ""
 
 
+def check_sentence_heuristics(sentence, word, examples):
+    return _sentence_heuristics(sentence, word.lower(), [_normalize(ex) for ex in examples])
+
+
+# Verdicts from Claude for this session, keyed by (sentence, word, definition).
+# Only real PASS/FAIL answers are kept; auto-approvals are retried next time.
+_SENTENCE_VERDICTS = {}
+
+# Kept open across calls so retries reuse the TCP/TLS session.
+_api_conn = None
+
+
+def _api_connection():
+    global _api_conn
+    if _api_conn is None:
+        _api_conn = http.client.HTTPSConnection(CLAUDE_API_HOST, timeout=30)
+    return _api_conn
+
+
+def _ask_claude_api(prompt_text, api_key):
+    body = _json_dumps({
+        "model": CLAUDE_API_MODEL,
+        "max_tokens": 200,
+        "messages": [{"role": "user", "content": prompt_text}],
+    })
+    headers = {
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01",
+        "content-type": "application/json",
+    }
+    conn = _api_connection()
+    # A kept-alive connection may have been dropped by the server while idle;
+    # in that case reconnect and send once more. Anything else (a timeout, a
+    # bad response) won't be helped by resending the request.
+    for attempt in range(2):
+        try:
+            conn.request("POST", "/v1/messages", body, headers)
+            resp = conn.getresponse()
+            break
+        except (ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if attempt:
+                return None
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            return None
+    # The server has answered by now, so a failure reading the body means the
+    # request was already handled; don't send it again.
+    try:
+        raw = resp.read()
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        return None
+    if resp.status != 200:
+        return None
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+    return "".join(b.get("text", "") for b in data.get("content", []) if b.get("type") == "text")
+
+
+def _ask_claude_cli(prompt_text):
+    try:
+        result = subprocess.run(
+            CLAUDE_CLI_ARGS,
+            input=prompt_text,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except FileNotFoundError:
+        return None
+    except subprocess.TimeoutExpired:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _api_key():
+    # Talk to the API directly when a key is available; VOCAB_USE_CLI forces
+    # the claude CLI, which uses whatever login the CLI already has.
+    if os.environ.get("VOCAB_USE_CLI"):
+        return None
+    return os.environ.get("ANTHROPIC_API_KEY")
+
+
+def _ask_claude(prompt_text):
+    api_key = _api_key()
+    if api_key:
+        return _ask_claude_api(prompt_text, api_key)
+    return _ask_claude_cli(prompt_text)
+
+
 def evaluate_sentence_with_claude(sentence, word, definition):
+    key = (sentence, word, definition)
+    if key in _SENTENCE_VERDICTS:
+        return _SENTENCE_VERDICTS[key]
     prompt_text = (
         f'You are evaluating whether a sentence correctly uses the word "{word}" '
         f"(meaning: {definition}).\n\n"
@@ -211,27 +411,54 @@ def evaluate_sentence_with_claude(sentence, word, definition):
         "is roughly correct.\n\n"
         "Reply with exactly one line: PASS or FAIL followed by a brief explanation."
     )
-    try:
-        result = subprocess.run(
-            ["claude", "-p", "--model", "sonnet", "--max-budget-usd", "0.05"],
-            input=prompt_text,
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode != 0:
-            return True, "Auto-approved (Claude unavailable)."
-        output = result.stdout.strip()
-        first_line = output.split("\n")[0]
-        if first_line.upper().startswith("PASS"):
-            return True, first_line
-        elif first_line.upper().startswith("FAIL"):
-            return False, first_line
-        return True, "Auto-approved (could not parse response)."
-    except FileNotFoundError:
-        return True, "Auto-approved (Claude unavailable)."
-    except subprocess.TimeoutExpired:
+    output = _ask_claude(prompt_text)
+    if output is None:
         return True, "Auto-approved (Claude unavailable)."
+    first_line = output.strip().split("\n")[0]
+    if first_line.upper().startswith("PASS"):
+        _SENTENCE_VERDICTS[key] = (True, first_line)
+        return True, first_line
+    elif first_line.upper().startswith("FAIL"):
+        _SENTENCE_VERDICTS[key] = (False, first_line)
+        return False, first_line
+    return True, "Auto-approved (could not parse response)."
+
+
+def evaluate_sentences_with_claude(sentences, word, definition):
+    # Evaluates several sentences with a single Claude request. Sentences whose
+    # verdict line is missing from the reply fall back to one call each.
+    pending = [s for s in dict.fromkeys(sentences) if (s, word, definition) not in _SENTENCE_VERDICTS]
+    unavailable = False
+    if len(pending) > 1:
+        numbered = "\n".join(f"{i}. {s}" for i, s in enumerate(pending, 1))
+        prompt_text = (
+            f'You are evaluating whether each sentence below correctly uses the word "{word}" '
+            f"(meaning: {definition}).\n\n"
+            f"{numbered}\n\n"
+            "Does each sentence demonstrate understanding of the word's meaning? "
+            "Be lenient - accept creative or informal usage as long as the meaning "
+            "is roughly correct.\n\n"
+            "Reply with exactly one line per sentence, in order: the sentence number, "
+            "then PASS or FAIL followed by a brief explanation."
+        )
+        output = _ask_claude(prompt_text)
+        unavailable = output is None
+        for match in _VERDICT_LINE_RE.finditer(output or ""):
+            index = int(match.group(1))
+            if 1 <= index <= len(pending):
+                verdict = match.group(2).upper()
+                feedback = f"{verdict} {match.group(3).strip()}".strip()
+                _SENTENCE_VERDICTS[(pending[index - 1], word, definition)] = (verdict == "PASS", feedback)
+    results = []
+    for s in sentences:
+        key = (s, word, definition)
+        if key in _SENTENCE_VERDICTS:
+            results.append(_SENTENCE_VERDICTS[key])
+        elif unavailable:
+            results.append((True, "Auto-approved (Claude unavailable)."))
+        else:
+            results.append(evaluate_sentence_with_claude(s, word, definition))
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -239,9 +466,25 @@ def evaluate_sentence_with_claude(sentence, word, definition):
 # ---------------------------------------------------------------------------
 
 
+# Parsed words.json, keyed by (path, mtime_ns) so an edited file is re-read.
+_words_cache = {}
+
+# (words.json entry, result queue) for a dictionary fetch that outlived
+# pick_word's wait; save_late_api_data stores its result once it arrives.
+_pending_api = None
+
+
 def load_words():
-    with open(WORDS_FILE, "r") as f:
-        return json.load(f)
+    key = (str(WORDS_FILE), os.stat(WORDS_FILE).st_mtime_ns)
+    if key not in _words_cache:
+        # Hand json the raw bytes in one read; it detects the UTF encoding
+        # itself, so there is no text-mode decoding layer in between.
+        with open(WORDS_FILE, "rb") as f:
+            # A tuple, since every caller shares the cached pool.
+            words = tuple(json.loads(f.read()))
+        _words_cache.clear()
+        _words_cache[key] = words
+    return _words_cache[key]
 
 
 def fetch_api_data(word):
@@ -249,12 +492,19 @@ def fetch_api_data(word):
         url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
         req = urllib.request.Request(url)
         with urllib.request.urlopen(req, timeout=5) as resp:
-            data = json.loads(resp.read().decode())
+            data = json.loads(resp.read())
         return data[0] if data else None
     except Exception:
         return None
 
 
+def fetch_api_data_async(word):
+    # Runs fetch_api_data on a daemon thread; its result lands in the queue.
+    result = queue.SimpleQueue()
+    threading.Thread(target=lambda: result.put(fetch_api_data(word)), daemon=True).start()
+    return result
+
+
 def format_api_data(api_entry, fallback):
     word = fallback.get("word", "")
     phonetic = fallback.get("phonetic", "")
@@ -302,6 +552,7 @@ def format_api_data(api_entry, fallback):
 
 
 def pick_word(conn, today=None):
+    global _pending_api
     today = today or datetime.date.today().isoformat()
 
     existing = get_todays_word(conn, today)
@@ -312,42 +563,89 @@ def pick_word(conn, today=None):
             match = next((w for w in all_words if w["word"] == api_data.get("word")), None)
             if match:
                 api_data = format_api_data(None, match)
-                conn.execute("UPDATE words_seen SET api_data = ? WHERE word = ?",
-                             (json.dumps(api_data), api_data["word"]))
+                conn.execute(_SQL_SAVE_API_DATA, (_json_dumps(api_data), api_data["word"]))
                 conn.commit()
         return api_data
 
     all_words = load_words()
     used = get_used_words(conn)
-    available = [w for w in all_words if w.get("word") not in used]
+    remaining = sum(1 for w in all_words if w.get("word") not in used)
 
-    if not available:
+    if not remaining:
         raise SystemExit("You've learned all the words! Impressive.")
 
-    chosen = random.choice(available)
-    api_entry = fetch_api_data(chosen["word"])
+    # Index into the unused words without building a list of them; randrange
+    # draws the same index random.choice would over that list.
+    target = random.randrange(remaining)
+    unused = (w for w in all_words if w.get("word") not in used)
+    chosen = next(itertools.islice(unused, target, None))
+    # The dictionary API is only an enrichment; wait briefly for it and show
+    # the offline definition rather than block on its full timeout. A late
+    # result is kept for save_late_api_data.
+    _pending_api = None
+    pending = fetch_api_data_async(chosen["word"])
+    try:
+        api_entry = pending.get(timeout=API_WAIT_SECONDS)
+    except queue.Empty:
+        api_entry = None
+        _pending_api = (chosen, pending)
     word_data = format_api_data(api_entry, chosen)
-    api_data_json = json.dumps(word_data)
+    api_data_json = _json_dumps(word_data)
     save_word_shown(conn, word_data["word"], api_data_json, today)
     return word_data
 
 
+def save_late_api_data(conn):
+    # Only the stored card is upgraded; the one on screen stays as the user
+    # studied it, and a resume later today shows the richer version.
+    global _pending_api
+    if _pending_api is None:
+        return
+    chosen, pending = _pending_api
+    try:
+        api_entry = pending.get_nowait()
+    except queue.Empty:
+        return
+    _pending_api = None
+    if api_entry:
+        word_data = format_api_data(api_entry, chosen)
+        # The row was saved under the words.json headword, which the API may
+        # spell differently.
+        conn.execute(_SQL_SAVE_API_DATA, (_json_dumps(word_data), chosen["word"]))
+        conn.commit()
+
+
 # ---------------------------------------------------------------------------
 # Display functions
 # ---------------------------------------------------------------------------
 
+_HEADER_BAR = f"{CYAN}{'=' * 50}{RESET}"
+_HEADER_SEP = f"{CYAN}{'-' * 50}{RESET}"
+_VICTORY_BAR = f"  {GREEN}{'*' * 44}{RESET}"
+_VICTORY_BLANK = f"  {GREEN}*                                          *{RESET}"
+_VICTORY_TOP = "\n".join((
+    _VICTORY_BAR,
+    _VICTORY_BLANK,
+    f"  {GREEN}*   {BOLD}Congratulations!{RESET}{GREEN}                      *{RESET}",
+))
+_VICTORY_BOTTOM = "\n".join((
+    _VICTORY_BLANK,
+    f"  {GREEN}*   Come back tomorrow for a new word!     *{RESET}",
+    _VICTORY_BLANK,
+    _VICTORY_BAR,
+))
+
 
 def clear_screen():
     print("\033[2J\033[H", end="")
 
 
 def show_header(word, streak):
-    width = 50
-    print(f"\n{CYAN}{'=' * width}{RESET}")
+    print(f"\n{_HEADER_BAR}")
     print(f"{CYAN}  {BOLD}VOCAB AGENT{RESET}{CYAN}  |  {YELLOW}Streak: {streak} day{'s' if streak != 1 else ''}{RESET}")
-    print(f"{CYAN}{'=' * width}{RESET}")
+    print(_HEADER_BAR)
     print(f"  Today's word: {BOLD}{MAGENTA}{word}{RESET}")
-    print(f"{CYAN}{'-' * width}{RESET}\n")
+    print(f"{_HEADER_SEP}\n")
 
 
 def show_word_card(word_data):
@@ -380,15 +678,10 @@ def show_word_card(word_data):
 
 def show_victory(word, streak):
     print()
-    print(f"  {GREEN}{'*' * 44}{RESET}")
-    print(f"  {GREEN}*                                          *{RESET}")
-    print(f"  {GREEN}*   {BOLD}Congratulations!{RESET}{GREEN}                      *{RESET}")
+    print(_VICTORY_TOP)
     print(f"  {GREEN}*   You mastered: {BOLD}{word:<23}{RESET}{GREEN} *{RESET}")
     print(f"  {GREEN}*   Current streak: {BOLD}{streak} day{'s' if streak != 1 else '':<18}{RESET}{GREEN}*{RESET}")
-    print(f"  {GREEN}*                                          *{RESET}")
-    print(f"  {GREEN}*   Come back tomorrow for a new word!     *{RESET}")
-    print(f"  {GREEN}*                                          *{RESET}")
-    print(f"  {GREEN}{'*' * 44}{RESET}")
+    print(_VICTORY_BOTTOM)
     print()
 
 
@@ -432,14 +725,17 @@ def recall_quiz(word, definition):
     print(f"  {DIM}Type the word that matches this definition.{RESET}\n")
 
     failures = 0
+    word_lc = word.lower()
     while True:
         answer = safe_input(f"  {CYAN}Word:{RESET} ").strip()
-        if answer.lower() == word.lower():
+        answer_lc = answer.lower()
+        if answer_lc == word_lc:
             print(f"  {GREEN}Correct!{RESET}")
             return True
 
         failures += 1
-        dist = levenshtein(answer.lower(), word.lower())
+        # Only "within two edits" matters, so let levenshtein stop early.
+        dist = levenshtein(answer_lc, word_lc, max_dist=2)
         if dist <= 2 and answer:
             print(f"  {YELLOW}Close! Check your spelling.{RESET}")
         elif failures >= 5:
@@ -447,7 +743,7 @@ def recall_quiz(word, definition):
             print(f"  {DIM}Type it below to confirm.{RESET}")
             while True:
                 confirm = safe_input(f"  {CYAN}Type it:{RESET} ").strip()
-                if confirm.lower() == word.lower():
+                if confirm.lower() == word_lc:
                     print(f"  {GREEN}Got it.{RESET}")
                     return True
                 print(f"  {YELLOW}Try again. The word is: {word}{RESET}")
@@ -463,7 +759,9 @@ def define_quiz(word, definitions):
     print(f"  {DIM}Define the word:{RESET} {BOLD}{MAGENTA}{word}{RESET}\n")
 
     failures = 0
+    word_lc = word.lower()
     all_def_text = " ".join(d.get("definition", "") for d in definitions)
+    ref_tokens = _tokenize(all_def_text)
 
     while True:
         answer = safe_input(f"  {CYAN}Your definition:{RESET} ").strip()
@@ -471,10 +769,10 @@ def define_quiz(word, definitions):
         if len(answer) < 15:
             print(f"  {YELLOW}Please provide a more detailed definition (at least 15 characters).{RESET}")
             continue
-        if word.lower() in answer.lower():
+        if word_lc in answer.lower():
             print(f"  {YELLOW}Try defining it without using the word itself.{RESET}")
             continue
-        if keyword_overlap(answer, all_def_text):
+        if _has_overlap(answer, ref_tokens):
             print(f"  {GREEN}Good definition!{RESET}")
             return True
 
@@ -493,12 +791,14 @@ def sentence_quiz(word, definition, examples):
     print(f"\n  {BOLD}Quiz Part C: Use It{RESET}")
     print(f"  {DIM}Write a sentence using the word:{RESET} {BOLD}{MAGENTA}{word}{RESET}\n")
 
+    word_lc = word.lower()
+    normalized_examples = [_normalize(ex) for ex in examples]
     while True:
         sentence = safe_input(f"  {CYAN}Sentence:{RESET} ").strip()
         if not sentence:
             continue
 
-        ok, msg = check_sentence_heuristics(sentence, word, examples)
+        ok, msg = _sentence_heuristics(sentence, word_lc, normalized_examples)
         if not ok:
             print(f"  {YELLOW}{msg}{RESET}")
             continue
@@ -550,11 +850,19 @@ def main():
 
     signal.signal(signal.SIGINT, sigint_handler)
 
+    if sys.stdin.isatty():
+        import readline  # noqa: F401 — imported for input() history side-effect
+
     VOCAB_DIR.mkdir(parents=True, exist_ok=True)
     today = datetime.date.today().isoformat()
 
     with sqlite3.connect(str(DB_PATH)) as conn:
         init_db(conn)
+        # Each helper commits so progress survives a force quit; in WAL mode
+        # with synchronous=NORMAL those commits append to the log without an
+        # fsync apiece, and the log is synced at checkpoints.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
 
         if is_today_completed(conn, today):
             streak = get_streak(conn, today)
@@ -572,6 +880,7 @@ def main():
         show_header(word, streak)
 
         phase_learn(word_data)
+        save_late_api_data(conn)
         phase_notes(conn, word, word_data)
 
         passed = False